@@ -0,0 +1,258 @@
+"""Async JSON API around the learning progress tracker and the path/resume generators.
+
+Run it standalone with `python api_server.py --port 8600`, or set LEARNING_API_PORT
+when starting the Streamlit app to serve it from the app's own process, where it
+shares users, progress data, saved paths and model caches with the UI.
+
+Endpoints (JSON in and out unless noted):
+    GET  /api/health
+    GET  /api/users/{user_id}/dashboard
+    GET  /api/users/{user_id}/insights
+    POST /api/users/{user_id}/activities   {"activity_type", "duration_minutes", "details"}
+    POST /api/users/{user_id}/skills       {"skill", "progress", "experience_points"}
+    POST /api/learning-paths               {"goal", "username" or "profile", "additional_skills",
+                                            "preferences", "use_previous_skills"}
+    POST /api/resumes                      {"goal", "username" or "profile"}
+    POST /api/flowcharts                   {"goal", "username" or "profile", "kind"} -> image/png
+
+Generation requests for a registered username use that user's saved profile. When
+LEARNING_API_TOKEN is set, every endpoint but /api/health needs an
+"Authorization: Bearer <token>" header.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from types import MappingProxyType
+
+from aiohttp import web
+
+BACKEND = web.AppKey("backend", object)
+TOKEN = web.AppKey("token", object)
+TRACKER_POOL = web.AppKey("tracker_pool", ThreadPoolExecutor)
+GENERATION_POOL = web.AppKey("generation_pool", ThreadPoolExecutor)
+
+
+def _json_default(value):
+    if isinstance(value, MappingProxyType):
+        return dict(value)
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def json_response(data, status=200):
+    return web.json_response(data, status=status, dumps=partial(json.dumps, default=_json_default))
+
+
+def bad_request(message):
+    return web.HTTPBadRequest(text=json.dumps({'error': message}), content_type="application/json")
+
+
+async def read_json(request):
+    try:
+        body = await request.json()
+    except ValueError:
+        raise bad_request("Request body must be JSON")
+    if not isinstance(body, dict):
+        raise bad_request("Request body must be a JSON object")
+    return body
+
+
+async def run_in(request, pool_key, fn, *args, **kwargs):
+    """Run blocking tracker or generator code off the event loop"""
+    return await asyncio.get_running_loop().run_in_executor(request.app[pool_key], partial(fn, *args, **kwargs))
+
+
+def resolve_user(backend, body):
+    """(username, profile, saved learning paths) for a generation request"""
+    username = body.get('username')
+    user = backend.get_app_store().users_db.get(username) if username else None
+    if user:
+        return username, user['profile'], user.get('learning_paths', [])
+    profile = body.get('profile')
+    if not isinstance(profile, dict):
+        raise bad_request("Send the username of a registered user or a profile object")
+    return username, profile, []
+
+
+def require_goal(body):
+    goal = body.get('goal')
+    if not isinstance(goal, str) or not goal.strip():
+        raise bad_request("'goal' is required")
+    return goal.strip()
+
+
+@web.middleware
+async def require_token(request, handler):
+    token = request.app[TOKEN]
+    if token and request.path != "/api/health" and request.headers.get("Authorization") != f"Bearer {token}":
+        return json_response({'error': "Unauthorized"}, status=401)
+    return await handler(request)
+
+
+async def health(request):
+    backend = request.app[BACKEND]
+    return json_response({'status': "ok", 'ai_enabled': bool(backend.model)})
+
+
+async def dashboard(request):
+    backend = request.app[BACKEND]
+    data = await run_in(request, TRACKER_POOL, backend.progress_tracker.get_user_dashboard_data, request.match_info['user_id'])
+    return json_response(data)
+
+
+async def insights(request):
+    backend = request.app[BACKEND]
+    data = await run_in(request, TRACKER_POOL, backend.progress_tracker.get_learning_insights, request.match_info['user_id'])
+    return json_response({'insights': data})
+
+
+async def log_activity(request):
+    backend = request.app[BACKEND]
+    body = await read_json(request)
+    activity_type = body.get('activity_type')
+    duration = body.get('duration_minutes', 0)
+    if not isinstance(activity_type, str) or not activity_type:
+        raise bad_request("'activity_type' is required")
+    if not isinstance(duration, int) or duration < 0:
+        raise bad_request("'duration_minutes' must be a non-negative integer")
+    activity = await run_in(request, TRACKER_POOL, backend.progress_tracker.log_daily_activity,
+                            request.match_info['user_id'], activity_type, duration, str(body.get('details', "")))
+    return json_response(activity, status=201)
+
+
+async def update_skill(request):
+    backend = request.app[BACKEND]
+    body = await read_json(request)
+    skill = body.get('skill')
+    progress = body.get('progress')
+    experience_points = body.get('experience_points', 0)
+    if not isinstance(skill, str) or not skill:
+        raise bad_request("'skill' is required")
+    if not isinstance(progress, (int, float)) or not isinstance(experience_points, int):
+        raise bad_request("'progress' must be a number and 'experience_points' an integer")
+    skill_data = await run_in(request, TRACKER_POOL, backend.progress_tracker.update_skill_progress,
+                              request.match_info['user_id'], skill, progress, experience_points)
+    return json_response(skill_data)
+
+
+async def learning_path(request):
+    backend = request.app[BACKEND]
+    body = await read_json(request)
+    goal = require_goal(body)
+    _, profile, _ = resolve_user(backend, body)
+    result = await run_in(
+        request, GENERATION_POOL, backend.generate_learning_path_ai, profile, goal,
+        additional_skills=str(body.get('additional_skills', "")),
+        preferences=str(body.get('preferences', "")),
+        use_previous_skills=bool(body.get('use_previous_skills', True))
+    )
+    if not result['success']:
+        return json_response({'error': result['error']}, status=502)
+    plan = result.get('plan')
+    return json_response({
+        'goal': goal,
+        'learning_path': result['learning_path'],
+        'plan': json.loads(plan.to_json()) if plan else None,
+        'ai_generated': result.get('ai_generated', True),
+        'usage': result.get('usage'),
+        'generated_at': result['generated_at']
+    })
+
+
+async def resume(request):
+    backend = request.app[BACKEND]
+    body = await read_json(request)
+    goal = require_goal(body)
+    username, profile, learning_paths = resolve_user(backend, body)
+    result = await run_in(request, GENERATION_POOL, backend.generate_ai_resume, profile, learning_paths,
+                          goal, user_name=username or profile.get('name') or "Learner")
+    if not result['success']:
+        return json_response({'error': result['error']}, status=502)
+    return json_response({'goal': goal, 'resume': result['resume'], 'usage': result['usage']})
+
+
+async def flowchart(request):
+    backend = request.app[BACKEND]
+    body = await read_json(request)
+    goal = require_goal(body)
+    _, profile, learning_paths = resolve_user(backend, body)
+    use_previous_skills = bool(body.get('use_previous_skills', True))
+    kind = body.get('kind', "learning_path")
+    if kind == "learning_path":
+        plan = backend.load_path_plan(learning_paths[-1]) if learning_paths else None
+        render = partial(backend.generate_learning_path_flowchart, profile, goal, use_previous_skills, plan)
+    elif kind == "career":
+        render = partial(backend.generate_career_readiness_flowchart, profile, goal, use_previous_skills)
+    else:
+        raise bad_request("'kind' must be 'learning_path' or 'career'")
+    image = await run_in(request, GENERATION_POOL, render)
+    if not image:
+        return json_response({'error': "Could not render the flowchart"}, status=500)
+    return web.Response(body=image, content_type="image/png")
+
+
+def create_app(backend, token=None, workers=8):
+    """aiohttp application serving `backend`, the namespace of the Streamlit app module"""
+    app = web.Application(middlewares=[require_token])
+    app[BACKEND] = backend
+    app[TOKEN] = token
+    # Generation gets its own pool so slow model calls never queue tracker requests
+    app[TRACKER_POOL] = ThreadPoolExecutor(max_workers=4, thread_name_prefix="api-tracker")
+    app[GENERATION_POOL] = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="api-generate")
+
+    async def shutdown_pools(app):
+        app[TRACKER_POOL].shutdown(wait=False)
+        app[GENERATION_POOL].shutdown(wait=False)
+
+    app.on_cleanup.append(shutdown_pools)
+    app.add_routes([
+        web.get("/api/health", health),
+        web.get("/api/users/{user_id}/dashboard", dashboard),
+        web.get("/api/users/{user_id}/insights", insights),
+        web.post("/api/users/{user_id}/activities", log_activity),
+        web.post("/api/users/{user_id}/skills", update_skill),
+        web.post("/api/learning-paths", learning_path),
+        web.post("/api/resumes", resume),
+        web.post("/api/flowcharts", flowchart),
+    ])
+    return app
+
+
+def serve_in_background(backend, port, host="127.0.0.1", token=None, workers=8):
+    """Start the API on a daemon thread with its own event loop"""
+    runner = web.AppRunner(create_app(backend, token, workers))
+    loop = asyncio.new_event_loop()
+    started = threading.Event()
+
+    def run():
+        asyncio.set_event_loop(loop)
+        loop.run_until_complete(runner.setup())
+        loop.run_until_complete(web.TCPSite(runner, host, port).start())
+        started.set()
+        loop.run_forever()
+
+    thread = threading.Thread(target=run, name="learning-api", daemon=True)
+    thread.start()
+    started.wait(timeout=10)
+    return thread
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8600)
+    parser.add_argument("--workers", type=int, default=8, help="Threads for generation requests")
+    args = parser.parse_args()
+
+    import model
+    web.run_app(create_app(model, os.environ.get("LEARNING_API_TOKEN"), args.workers), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,241 @@
+"""Generate learning paths, flowcharts and resumes for many users without the web UI.
+
+Reads one user per row from a CSV or JSONL file and writes each user's results
+to the output directory as soon as they are ready:
+
+    <output>/<row id>/learning_path.md    rendered learning path
+    <output>/<row id>/plan.json           structured plan, when the model returned one
+    <output>/<row id>/learning_path.png   learning path flowchart
+    <output>/<row id>/career_path.png     career readiness flowchart
+    <output>/<row id>/resume.md           AI resume, when an API key is configured
+    <output>/manifest.jsonl               one line per finished row
+
+Rows already marked "ok" in the manifest are skipped, so an interrupted run can
+be restarted with the same arguments. Columns: username and goal are required;
+email, bio, experience_level, skills, learning_goals, interests, time_commitment,
+learning_style, difficulty_preference, additional_skills, preferences and
+use_previous_skills are optional. List columns are comma or semicolon separated
+in CSV files.
+
+Usage:
+    python batch_generate.py users.csv --output batch_output [--workers 4] [--rpm 30]
+
+Set GEMINI_FAKE_MODEL=1 for a dry run against the offline model.
+"""
+
+import argparse
+import csv
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import model
+
+LIST_FIELDS = ("skills", "learning_goals", "interests")
+PROFILE_DEFAULTS = {
+    'skills': [],
+    'experience_level': 'Beginner',
+    'bio': '',
+    'learning_goals': [],
+    'interests': [],
+    'time_commitment': '1-5 hours',
+    'learning_style': 'Visual',
+    'difficulty_preference': 'Beginner-friendly',
+}
+
+
+class RateLimiter:
+    """Allows at most `per_minute` acquisitions in any sliding 60 second window"""
+
+    def __init__(self, per_minute):
+        self.per_minute = per_minute
+        self.acquired = 0
+        self._times = deque()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                while self._times and now - self._times[0] >= 60:
+                    self._times.popleft()
+                if len(self._times) < self.per_minute:
+                    self._times.append(now)
+                    self.acquired += 1
+                    return
+                wait_for = 60 - (now - self._times[0])
+            time.sleep(wait_for)
+
+
+class RateLimitedModel:
+    """Rate limits generate_content calls on one model tier.
+
+    Installed below hedging and failover, so each request actually sent takes a
+    token. A prompt cache creation rides on the request that triggers it.
+    """
+
+    def __init__(self, wrapped, limiter):
+        self._model = wrapped
+        self.limiter = limiter
+
+    def generate_content(self, *args, **kwargs):
+        self.limiter.acquire()
+        return self._model.generate_content(*args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self._model, name)
+
+
+def read_rows(path):
+    with open(path, encoding="utf-8", newline="") as input_file:
+        if path.lower().endswith((".jsonl", ".ndjson")):
+            return [json.loads(line) for line in input_file if line.strip()]
+        return list(csv.DictReader(input_file))
+
+
+def split_list(value):
+    if isinstance(value, list):
+        return [str(item).strip() for item in value if str(item).strip()]
+    return [item.strip() for item in re.split(r"[,;]", value or "") if item.strip()]
+
+
+def row_id(row):
+    """Stable id for a row: a readable username slug plus a hash of the row's contents"""
+    slug = re.sub(r"[^A-Za-z0-9_-]+", "_", str(row['username'])).strip("_") or "user"
+    digest = hashlib.sha1(json.dumps(row, sort_keys=True, default=str).encode("utf-8")).hexdigest()[:8]
+    return f"{slug}_{digest}"
+
+
+def build_profile(row):
+    profile = dict(PROFILE_DEFAULTS)
+    for field in PROFILE_DEFAULTS:
+        if row.get(field) not in (None, ""):
+            profile[field] = split_list(row[field]) if field in LIST_FIELDS else str(row[field])
+    profile['email'] = row.get('email', '')
+    return profile
+
+
+def load_finished(manifest_path):
+    finished = set()
+    if os.path.exists(manifest_path):
+        with open(manifest_path, encoding="utf-8") as manifest:
+            for line in manifest:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue  # a line cut short by an interrupted run
+                if entry.get('status') == "ok":
+                    finished.add(entry['id'])
+    return finished
+
+
+def write_file(directory, name, content):
+    mode = "wb" if isinstance(content, bytes) else "w"
+    with open(os.path.join(directory, name), mode, **({} if mode == "wb" else {"encoding": "utf-8"})) as out:
+        out.write(content)
+    return name
+
+
+def process_row(row, output_dir, flowcharts=True):
+    started = time.perf_counter()
+    directory = os.path.join(output_dir, row_id(row))
+    os.makedirs(directory, exist_ok=True)
+    profile = build_profile(row)
+    goal = str(row['goal'])
+    use_previous_skills = str(row.get('use_previous_skills', "yes")).strip().lower() not in ("no", "false", "0")
+    files = []
+
+    result = model.generate_learning_path_ai(
+        profile, goal,
+        additional_skills=row.get('additional_skills', ""),
+        preferences=row.get('preferences', ""),
+        use_previous_skills=use_previous_skills
+    )
+    if not result['success']:
+        raise RuntimeError(result['error'])
+    files.append(write_file(directory, "learning_path.md", result['learning_path']))
+
+    plan = result.get('plan')
+    path_data = {'goal': goal}
+    if plan:
+        files.append(write_file(directory, "plan.json", plan.to_json()))
+        path_data['plan_hash'] = model.get_path_store().put(plan.to_json())
+
+    if flowcharts:
+        for name, image in (
+            ("learning_path.png", model.generate_learning_path_flowchart(profile, goal, use_previous_skills, plan)),
+            ("career_path.png", model.generate_career_readiness_flowchart(profile, goal, use_previous_skills)),
+        ):
+            if image:
+                files.append(write_file(directory, name, image))
+
+    # Resumes need the model; without an API key rows still get their local paths and flowcharts
+    resume_usage = None
+    if model.model:
+        resume = model.generate_ai_resume(profile, [path_data], goal, user_name=str(row['username']))
+        if not resume['success']:
+            raise RuntimeError(resume['error'])
+        files.append(write_file(directory, "resume.md", resume['resume']))
+        resume_usage = resume['usage']
+
+    return {'files': files, 'seconds': round(time.perf_counter() - started, 2),
+            'ai_generated': result.get('ai_generated', True),
+            'usage': {'learning_path': result.get('usage'), 'resume': resume_usage}}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("input", help="CSV or JSONL file with one user per row")
+    parser.add_argument("--output", default="batch_output", help="Directory for generated files and the manifest")
+    parser.add_argument("--workers", type=int, default=4, help="Rows processed concurrently")
+    parser.add_argument("--rpm", type=int, default=30, help="Maximum Gemini requests per minute")
+    parser.add_argument("--no-flowcharts", action="store_true", help="Skip rendering flowchart images")
+    args = parser.parse_args()
+
+    rows = read_rows(args.input)
+    missing = [index for index, row in enumerate(rows, start=1) if not row.get('username') or not row.get('goal')]
+    if missing:
+        parser.error(f"rows without a username or goal: {', '.join(map(str, missing))}")
+
+    os.makedirs(args.output, exist_ok=True)
+    manifest_path = os.path.join(args.output, "manifest.jsonl")
+    finished = load_finished(manifest_path)
+    pending = [row for row in rows if row_id(row) not in finished]
+    print(f"{len(rows)} rows, {len(rows) - len(pending)} already done, {len(pending)} to generate")
+
+    limiter = None
+    if model.model:
+        limiter = RateLimiter(args.rpm)
+        model.model = model.configure_gemini(wrap_requests=lambda tier_model: RateLimitedModel(tier_model, limiter))
+
+    ok = failed = 0
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.workers) as pool, open(manifest_path, "a", encoding="utf-8") as manifest:
+        futures = {pool.submit(process_row, row, args.output, not args.no_flowcharts): row for row in pending}
+        for done in as_completed(futures):
+            row = futures[done]
+            entry = {'id': row_id(row), 'username': row['username'], 'goal': row['goal']}
+            try:
+                entry.update(status="ok", **done.result())
+                ok += 1
+            except Exception as e:
+                entry.update(status="error", error=str(e))
+                failed += 1
+            manifest.write(json.dumps(entry) + "\n")
+            manifest.flush()
+            print(f"[{ok + failed}/{len(pending)}] {entry['status']:<5} {entry['id']}"
+                  + (f" ({entry['seconds']}s)" if entry['status'] == "ok" else f": {entry['error']}"))
+
+    elapsed = time.perf_counter() - started
+    print(f"\n{ok} ok, {failed} failed in {elapsed:.1f}s"
+          f" - {ok / elapsed * 60 if elapsed else 0:.1f} users/min"
+          + (f", {limiter.acquired / elapsed:.2f} model requests/s" if limiter else ""))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Load-test the JSON API with a mix of tracker and generation requests.
+
+Start the API first (`python api_server.py`, or the Streamlit app with
+LEARNING_API_PORT set), then run this against it. Each simulated user logs
+activities, updates skills and reads its dashboard and insights; a share of
+requests can also generate learning paths. Reports throughput plus latency
+percentiles and error counts per endpoint.
+
+Usage:
+    python bench_api.py [--url http://127.0.0.1:8600] [--requests 2000] [--concurrency 50] [--generate-share 0.02]
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import time
+from collections import defaultdict
+
+import aiohttp
+import numpy as np
+
+SKILLS = ["Python", "SQL", "Statistics", "Machine Learning", "Docker", "React"]
+GOALS = ["Become a Data Scientist", "Become a Web Developer", "Become a Cloud Engineer"]
+
+
+def pick_request(rng, users, generate_share):
+    user = rng.choice(users)
+    if rng.random() < generate_share:
+        profile = {'experience_level': "Beginner", 'skills': rng.sample(SKILLS, 2), 'time_commitment': "5-10 hours"}
+        return "learning-paths", "POST", "/api/learning-paths", {'goal': rng.choice(GOALS), 'profile': profile}
+    kind = rng.choices(["activities", "skills", "dashboard", "insights"], weights=[40, 15, 30, 15])[0]
+    if kind == "activities":
+        body = {'activity_type': rng.choice(["study", "course", "project"]), 'duration_minutes': rng.randint(10, 90)}
+        return kind, "POST", f"/api/users/{user}/activities", body
+    if kind == "skills":
+        body = {'skill': rng.choice(SKILLS), 'progress': rng.randint(0, 100), 'experience_points': 10}
+        return kind, "POST", f"/api/users/{user}/skills", body
+    return kind, "GET", f"/api/users/{user}/{kind}", None
+
+
+async def worker(session, base_url, queue, results):
+    while True:
+        try:
+            kind, method, path, body = queue.get_nowait()
+        except asyncio.QueueEmpty:
+            return
+        start = time.perf_counter()
+        try:
+            async with session.request(method, base_url + path, json=body) as response:
+                await response.read()
+                ok = response.status < 400
+        except aiohttp.ClientError:
+            ok = False
+        results[kind].append((time.perf_counter() - start, ok))
+
+
+async def run(args):
+    rng = random.Random(args.seed)
+    users = [f"loadtest_{i}" for i in range(args.users)]
+    queue = asyncio.Queue()
+    for _ in range(args.requests):
+        queue.put_nowait(pick_request(rng, users, args.generate_share))
+
+    headers = {'Authorization': f"Bearer {args.token}"} if args.token else {}
+    results = defaultdict(list)
+    connector = aiohttp.TCPConnector(limit=args.concurrency)
+    async with aiohttp.ClientSession(connector=connector, headers=headers) as session:
+        start = time.perf_counter()
+        await asyncio.gather(*(worker(session, args.url, queue, results) for _ in range(args.concurrency)))
+        elapsed = time.perf_counter() - start
+
+    print(f"{'endpoint':<16}{'count':>7}{'errors':>8}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}")
+    for kind, samples in sorted(results.items()):
+        latencies = np.array([latency for latency, _ in samples]) * 1000
+        errors = sum(1 for _, ok in samples if not ok)
+        p50, p95, p99 = np.percentile(latencies, [50, 95, 99])
+        print(f"{kind:<16}{len(samples):>7}{errors:>8}{p50:>9.1f}{p95:>9.1f}{p99:>9.1f}")
+    print(f"\n{args.requests} requests in {elapsed:.1f}s - {args.requests / elapsed:.0f} req/s at concurrency {args.concurrency}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default="http://127.0.0.1:8600", help="Base URL of the API")
+    parser.add_argument("--requests", type=int, default=2000, help="Total requests to send")
+    parser.add_argument("--concurrency", type=int, default=50, help="Requests in flight at once")
+    parser.add_argument("--users", type=int, default=200, help="Distinct simulated users")
+    parser.add_argument("--generate-share", type=float, default=0.0, help="Share of requests that generate a learning path")
+    parser.add_argument("--token", default=os.environ.get("LEARNING_API_TOKEN"), help="Bearer token, if the API needs one")
+    parser.add_argument("--seed", type=int, default=7)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
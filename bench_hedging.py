@@ -0,0 +1,66 @@
+"""Benchmark hedged Gemini requests against the offline fake model.
+
+Sends the same workload twice, once directly and once through the app's hedging
+policy, and reports latency percentiles plus the hedge rate and hedge win rate.
+No API key or network access is needed.
+
+Usage:
+    python bench_hedging.py [--requests 300] [--concurrency 8] [--median 0.2] [--slow-rate 0.05] [--budget 60]
+"""
+
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+import model
+
+
+def run_workload(target, n_requests, concurrency):
+    def one(i):
+        start = time.perf_counter()
+        target.generate_content(f"Request {i}")
+        return time.perf_counter() - start
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        return np.array(list(pool.map(one, range(n_requests))))
+
+
+def describe(label, latencies):
+    p50, p95, p99 = np.percentile(latencies, [50, 95, 99])
+    print(f"{label:<10}{p50:>9.3f}{p95:>9.3f}{p99:>9.3f}{latencies.max():>9.3f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=300, help="Requests per run")
+    parser.add_argument("--concurrency", type=int, default=8, help="Concurrent callers")
+    parser.add_argument("--median", type=float, default=0.2, help="Fake model median latency in seconds")
+    parser.add_argument("--slow-rate", type=float, default=0.05, help="Share of requests that are slow outliers")
+    parser.add_argument("--slow-factor", type=float, default=10.0, help="How much slower an outlier is")
+    parser.add_argument("--budget", type=int, default=60, help="Hedges allowed per minute")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    fake = model.FakeGenerativeModel(args.median, args.slow_rate, args.slow_factor, seed=args.seed)
+    policy = model.HedgingPolicy(budget_per_minute=args.budget, max_workers=args.concurrency * 2)
+    hedged = model.HedgedModel(fake, policy)
+
+    # Warm the latency window so the policy has a p95 to hedge against
+    run_workload(hedged, policy.min_samples, args.concurrency)
+    warmup = policy.metrics()
+
+    print(f"{'run':<10}{'p50 s':>9}{'p95 s':>9}{'p99 s':>9}{'max s':>9}")
+    describe("direct", run_workload(fake, args.requests, args.concurrency))
+    describe("hedged", run_workload(hedged, args.requests, args.concurrency))
+
+    metrics = policy.metrics()
+    hedged_count = metrics['hedged'] - warmup['hedged']
+    wins = metrics['hedge_wins'] - warmup['hedge_wins']
+    print(f"\nhedge threshold (p95): {metrics['p95_seconds']['default']:.3f}s")
+    print(f"hedge rate: {hedged_count / args.requests:.1%}  win rate: {wins / hedged_count if hedged_count else 0:.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Benchmark prompt prefix caching against the offline fake model.
+
+Sends repeated learning path and resume requests with their static instructions
+either inline or as a cached prefix, and reports mean latency and the share of
+input tokens served from the cache. No API key or network access is needed.
+
+Usage:
+    python bench_prompt_cache.py [--requests 50] [--median 0.05] [--token-latency 0.0005]
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+import model
+
+SAMPLE_REQUESTS = {
+    "learning_path": (model.LEARNING_PATH_SYSTEM_PROMPT,
+                      "USER PROFILE:\n- Experience Level: Beginner\n- Current Skills: Python, SQL\n"
+                      "LEARNING REQUEST:\n- Primary Goal: Become a Data Scientist"),
+    "resume": (model.RESUME_SYSTEM_PROMPT,
+               "PERSONAL INFORMATION:\n- Name: alice\n- Skills: Python, SQL\n- Career Goal: Data Scientist"),
+}
+
+
+def run(target, prefix, fresh, n_requests, cached):
+    latencies, cached_tokens, prompt_tokens = [], 0, 0
+    for _ in range(n_requests):
+        start = time.perf_counter()
+        if cached:
+            response = target.generate_content(fresh, prefix=prefix)
+        else:
+            response = target.generate_content(f"{prefix}\n{fresh}")
+        latencies.append(time.perf_counter() - start)
+        usage = model.prompt_usage(response)
+        cached_tokens += usage['cached_tokens']
+        prompt_tokens += usage['prompt_tokens']
+    return np.mean(latencies), cached_tokens / prompt_tokens
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=50, help="Requests per run")
+    parser.add_argument("--median", type=float, default=0.05, help="Fake model median latency in seconds")
+    parser.add_argument("--token-latency", type=float, default=0.0005, help="Fake model latency per fresh input token")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    fake = model.FakeGenerativeModel(args.median, slow_rate=0.0, seed=args.seed, input_token_latency=args.token_latency)
+    cached_model = model.PrefixCachedModel(fake, model.GEMINI_MODEL_NAME)
+
+    print(f"{'request':<16}{'inline s':>10}{'cached s':>10}{'from cache':>12}")
+    for name, (prefix, fresh) in SAMPLE_REQUESTS.items():
+        inline_latency, _ = run(fake, prefix, fresh, args.requests, cached=False)
+        cached_latency, cached_share = run(cached_model, prefix, fresh, args.requests, cached=True)
+        print(f"{name:<16}{inline_latency:>10.3f}{cached_latency:>10.3f}{cached_share:>12.0%}")
+
+
+if __name__ == "__main__":
+    main()
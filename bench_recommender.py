@@ -0,0 +1,83 @@
+"""Benchmark the next-skill recommender on a synthetic user population.
+
+Builds the skill co-occurrence matrix incrementally from users whose skills
+cluster by field (with some cross-field noise), then reports update throughput
+and per-user recommendation latency, both on a settled matrix and with skill
+updates interleaved between reads. No API key or network access is needed.
+
+Usage:
+    python bench_recommender.py [--users 100000] [--queries 5000]
+"""
+
+import argparse
+import random
+import time
+
+import numpy as np
+
+import model
+
+
+def synthetic_users(n_users, rng):
+    """Yield (user id, skills), each user drawn from one field's skills and their prerequisites"""
+    fields = []
+    for targets in model.FIELD_TARGET_SKILLS.values():
+        closure = set(targets).union(*(model.get_skill_planner().prerequisites[skill] for skill in targets))
+        fields.append(sorted(closure))
+    all_skills = sorted(model.SKILL_GRAPH)
+    for i in range(n_users):
+        field = rng.choice(fields)
+        skills = rng.sample(field, min(len(field), rng.randint(2, 6)))
+        if rng.random() < 0.3:
+            skills.append(rng.choice(all_skills))
+        yield f"user_{i}", skills
+
+
+def percentiles_us(latencies):
+    return np.percentile(np.array(latencies) * 1e6, [50, 99])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=100_000, help="Synthetic users")
+    parser.add_argument("--queries", type=int, default=5000, help="Recommendations to time per run")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    recommender = model.SkillCooccurrenceRecommender()
+    start = time.perf_counter()
+    for user_id, skills in synthetic_users(args.users, rng):
+        recommender.update_user(user_id, profile_skills=skills)
+    build = time.perf_counter() - start
+
+    start = time.perf_counter()
+    recommender.recommend("user_0")
+    fold = time.perf_counter() - start
+
+    queries = [f"user_{rng.randrange(args.users)}" for _ in range(args.queries)]
+    settled = []
+    for user_id in queries:
+        start = time.perf_counter()
+        recommender.recommend(user_id)
+        settled.append(time.perf_counter() - start)
+
+    all_skills = sorted(model.SKILL_GRAPH)
+    interleaved = []
+    for user_id in queries:
+        recommender.update_user(user_id, progress_skills=[rng.choice(all_skills)])
+        start = time.perf_counter()
+        recommender.recommend(user_id)
+        interleaved.append(time.perf_counter() - start)
+
+    print(f"{args.users} users, {len(recommender.skill_names)} skills")
+    print(f"build {build:.2f}s ({args.users / build:,.0f} users/s), first fold {fold * 1000:.1f} ms")
+    print(f"{'reads':<14}{'p50 us':>10}{'p99 us':>10}")
+    for name, latencies in (("settled", settled), ("after update", interleaved)):
+        p50, p99 = percentiles_us(latencies)
+        print(f"{name:<14}{p50:>10.0f}{p99:>10.0f}")
+    print("sample:", queries[0], "->", recommender.recommend(queries[0]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Benchmark offline speech recognition speed on sample WAV files.
+
+Reports the real-time factor (processing time / audio duration) for whole-clip
+recognition and for the silence-chunked background transcription used by the
+AI assistant's voice mode. RTF below 1.0 means faster than real time.
+
+Usage:
+    python bench_transcription.py [--samples samples/audio] [--backend sphinx|vosk] [--generate]
+
+With --generate (or when the samples directory is empty) a few sample clips are
+synthesized first with the app's text-to-speech worker.
+"""
+
+import argparse
+import glob
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import model
+
+SAMPLE_SENTENCES = [
+    "How long will it take me to become a data scientist if I study five hours a week?",
+    "I already know Python and SQL. Which machine learning courses should I take next? "
+    "I prefer hands-on projects over long video lectures.",
+    "Can you suggest a portfolio project for a junior web developer? "
+    "It should use React on the front end and Node.js on the back end. "
+    "I would also like to learn how to deploy it to the cloud.",
+]
+
+
+def generate_samples(samples_dir):
+    os.makedirs(samples_dir, exist_ok=True)
+    worker = model.TextToSpeechWorker()
+    for i, sentence in enumerate(SAMPLE_SENTENCES, start=1):
+        wav_bytes = worker.synthesize(sentence)
+        with open(os.path.join(samples_dir, f"sample_{i}.wav"), "wb") as wav_file:
+            wav_file.write(wav_bytes)
+    print(f"Generated {len(SAMPLE_SENTENCES)} sample clips in {samples_dir}")
+
+
+def benchmark_file(path, backend, pool):
+    with open(path, "rb") as wav_file:
+        wav_bytes = wav_file.read()
+    samples, sample_rate = model.read_wav_samples(wav_bytes)
+    duration = len(samples) / sample_rate
+
+    start = time.perf_counter()
+    model.recognize_chunk(samples, sample_rate, backend)
+    whole_time = time.perf_counter() - start
+
+    # transcribe_audio splits on silence itself, so count the chunks outside the timed region
+    n_chunks = len(list(model.split_on_silence(samples, sample_rate)))
+    start = time.perf_counter()
+    model.transcribe_audio(wav_bytes, backend=backend, pool=pool)
+    chunked_time = time.perf_counter() - start
+
+    return duration, n_chunks, whole_time, chunked_time
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--samples", default=os.path.join("samples", "audio"), help="Directory of WAV files")
+    parser.add_argument("--backend", default=model.SPEECH_BACKEND, choices=["sphinx", "vosk"])
+    parser.add_argument("--workers", type=int, default=2, help="Background transcription workers")
+    parser.add_argument("--generate", action="store_true", help="Synthesize sample clips before benchmarking")
+    args = parser.parse_args()
+
+    wav_paths = sorted(glob.glob(os.path.join(args.samples, "*.wav")))
+    if args.generate or not wav_paths:
+        generate_samples(args.samples)
+        wav_paths = sorted(glob.glob(os.path.join(args.samples, "*.wav")))
+
+    pool = ThreadPoolExecutor(max_workers=args.workers)
+    total_audio = total_whole = total_chunked = 0.0
+
+    print(f"{'file':<24}{'audio s':>9}{'chunks':>8}{'whole RTF':>11}{'chunked RTF':>13}")
+    for path in wav_paths:
+        duration, n_chunks, whole_time, chunked_time = benchmark_file(path, args.backend, pool)
+        total_audio += duration
+        total_whole += whole_time
+        total_chunked += chunked_time
+        print(f"{os.path.basename(path):<24}{duration:>9.2f}{n_chunks:>8}"
+              f"{whole_time / duration:>11.3f}{chunked_time / duration:>13.3f}")
+
+    if total_audio:
+        print(f"{'TOTAL':<24}{total_audio:>9.2f}{'':>8}"
+              f"{total_whole / total_audio:>11.3f}{total_chunked / total_audio:>13.3f}")
+    pool.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+import os
+import sys
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+# The app module configures Gemini at import time; the offline model keeps tests off the network
+os.environ.setdefault("GEMINI_FAKE_MODEL", "1")
+os.environ.setdefault("GEMINI_FAKE_LATENCY", "0.01")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import model  # noqa: E402
+
+
+@pytest.fixture
+def store():
+    """A private app store, so tests don't share users or progress"""
+    return SimpleNamespace(
+        users_db={},
+        learning_progress_data=model.new_progress_data(),
+        dashboard_snapshots={},
+        parsed_plans={},
+        lock=threading.RLock()
+    )
+
+
+@pytest.fixture
+def tracker(store):
+    return model.LearningProgressTracker(store)
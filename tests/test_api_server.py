@@ -0,0 +1,76 @@
+import asyncio
+from types import SimpleNamespace
+
+from aiohttp.test_utils import TestClient, TestServer
+
+import api_server
+import model
+
+
+def make_backend(store, tracker):
+    return SimpleNamespace(
+        model=model.model,
+        progress_tracker=tracker,
+        get_app_store=lambda: store,
+        generate_learning_path_ai=model.generate_learning_path_ai,
+        generate_ai_resume=model.generate_ai_resume,
+        load_path_plan=model.load_path_plan,
+        generate_learning_path_flowchart=model.generate_learning_path_flowchart,
+        generate_career_readiness_flowchart=model.generate_career_readiness_flowchart
+    )
+
+
+def call_api(backend, requests, token=None):
+    """Send (method, path, json, headers) requests to a fresh app; returns (status, body) pairs"""
+    async def run():
+        async with TestClient(TestServer(api_server.create_app(backend, token, workers=2))) as client:
+            responses = []
+            for method, path, body, headers in requests:
+                response = await client.request(method, path, json=body, headers=headers or {})
+                payload = await response.json() if response.content_type == "application/json" else await response.read()
+                responses.append((response.status, payload))
+            return responses
+    return asyncio.run(run())
+
+
+def test_activity_and_skill_writes_show_up_in_the_dashboard(store, tracker):
+    (activity_status, _), (skill_status, skill), (dashboard_status, dashboard) = call_api(make_backend(store, tracker), [
+        ("POST", "/api/users/ann/activities", {'activity_type': "Study", 'duration_minutes': 30}, None),
+        ("POST", "/api/users/ann/skills", {'skill': "Python", 'progress': 55}, None),
+        ("GET", "/api/users/ann/dashboard", None, None),
+    ])
+    assert (activity_status, skill_status, dashboard_status) == (201, 200, 200)
+    assert [milestone['percentage'] for milestone in skill['milestones']] == [25, 50]
+    assert dashboard['skills']['Python']['progress'] == 55
+    assert set(store.learning_progress_data['data_versions']) == {"ann"}
+
+
+def test_invalid_bodies_are_rejected(store, tracker):
+    responses = call_api(make_backend(store, tracker), [
+        ("POST", "/api/users/ann/activities", {'activity_type': "Study", 'duration_minutes': -5}, None),
+        ("POST", "/api/users/ann/skills", {'progress': 10}, None),
+        ("POST", "/api/learning-paths", {'goal': " "}, None),
+        ("POST", "/api/learning-paths", {'goal': "Data Science"}, None),
+    ])
+    assert [status for status, _ in responses] == [400, 400, 400, 400]
+    assert all('error' in body for _, body in responses)
+
+
+def test_learning_paths_use_a_registered_users_profile(store, tracker):
+    store.users_db['ann'] = {'profile': {'skills': ["Python"], 'experience_level': "Intermediate"}, 'learning_paths': []}
+    (status, body), = call_api(make_backend(store, tracker), [
+        ("POST", "/api/learning-paths", {'goal': "Become a Data Scientist", 'username': "ann"}, None),
+    ])
+    assert status == 200
+    assert body['goal'] == "Become a Data Scientist" and body['learning_path']
+    assert body['plan']['phases'] and body['ai_generated']
+
+
+def test_token_guards_everything_but_health(store, tracker):
+    responses = call_api(make_backend(store, tracker), [
+        ("GET", "/api/health", None, None),
+        ("GET", "/api/users/ann/insights", None, None),
+        ("GET", "/api/users/ann/insights", None, {'Authorization': "Bearer secret"}),
+    ], token="secret")
+    assert [status for status, _ in responses] == [200, 401, 200]
+    assert responses[0][1]['status'] == "ok"
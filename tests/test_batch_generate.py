@@ -0,0 +1,93 @@
+import csv
+import json
+import os
+import sys
+
+import pytest
+
+import batch_generate
+import model
+
+
+@pytest.fixture
+def users_csv(tmp_path):
+    path = tmp_path / "users.csv"
+    with open(path, "w", encoding="utf-8", newline="") as users_file:
+        writer = csv.DictWriter(users_file, fieldnames=["username", "goal", "skills", "experience_level"])
+        writer.writeheader()
+        writer.writerow({'username': "ann lee", 'goal': "Become a Data Scientist", 'skills': "Python; SQL",
+                         'experience_level': "Intermediate"})
+        writer.writerow({'username': "bob", 'goal': "Learn Web Development", 'skills': "", 'experience_level': ""})
+    return str(path)
+
+
+def run_cli(monkeypatch, *args):
+    # main() swaps in a rate-limited router; keep it from leaking into other tests
+    monkeypatch.setattr(model, "model", model.model)
+    monkeypatch.setattr(sys, "argv", ["batch_generate.py", *args])
+    batch_generate.main()
+
+
+def test_rows_are_read_from_csv_and_jsonl(tmp_path, users_csv):
+    jsonl = tmp_path / "users.jsonl"
+    jsonl.write_text('{"username": "cy", "goal": "DevOps", "skills": ["Docker"]}\n\n', encoding="utf-8")
+    assert [row['username'] for row in batch_generate.read_rows(users_csv)] == ["ann lee", "bob"]
+    assert batch_generate.read_rows(str(jsonl)) == [{'username': "cy", 'goal': "DevOps", 'skills': ["Docker"]}]
+
+
+def test_profiles_fill_defaults_and_split_lists(users_csv):
+    ann, bob = batch_generate.read_rows(users_csv)
+    assert batch_generate.build_profile(ann)['skills'] == ["Python", "SQL"]
+    assert batch_generate.build_profile(ann)['experience_level'] == "Intermediate"
+    assert batch_generate.build_profile(bob)['skills'] == []
+    assert batch_generate.build_profile(bob)['experience_level'] == "Beginner"
+
+
+def test_row_ids_are_readable_and_change_with_the_row():
+    row = {'username': "ann lee/..", 'goal': "Data"}
+    assert batch_generate.row_id(row).startswith("ann_lee_")
+    assert batch_generate.row_id(row) == batch_generate.row_id(dict(row))
+    assert batch_generate.row_id({**row, 'goal': "Web"}) != batch_generate.row_id(row)
+
+
+def test_finished_rows_skip_errors_and_truncated_lines(tmp_path):
+    manifest = tmp_path / "manifest.jsonl"
+    manifest.write_text('{"id": "a", "status": "ok"}\n{"id": "b", "status": "error"}\n{"id": "c", "sta',
+                        encoding="utf-8")
+    assert batch_generate.load_finished(str(manifest)) == {"a"}
+    assert batch_generate.load_finished(str(tmp_path / "missing.jsonl")) == set()
+
+
+def test_process_row_writes_the_path_plan_and_resume(tmp_path, users_csv):
+    row = batch_generate.read_rows(users_csv)[0]
+    result = batch_generate.process_row(row, str(tmp_path), flowcharts=False)
+    directory = tmp_path / batch_generate.row_id(row)
+    assert sorted(result['files']) == sorted(os.listdir(directory))
+    assert sorted(result['files']) == ["learning_path.md", "plan.json", "resume.md"]
+    assert json.loads((directory / "plan.json").read_text(encoding="utf-8"))['phases']
+
+
+def test_cli_resumes_from_the_manifest(tmp_path, users_csv, monkeypatch, capsys):
+    output = str(tmp_path / "out")
+    run_cli(monkeypatch, users_csv, "--output", output, "--no-flowcharts", "--rpm", "1000")
+    assert "2 ok, 0 failed" in capsys.readouterr().out
+
+    run_cli(monkeypatch, users_csv, "--output", output, "--no-flowcharts")
+    assert "2 rows, 2 already done, 0 to generate" in capsys.readouterr().out
+    with open(os.path.join(output, "manifest.jsonl"), encoding="utf-8") as manifest:
+        assert [json.loads(line)['status'] for line in manifest] == ["ok", "ok"]
+
+
+def test_cli_rejects_rows_without_a_goal(tmp_path, monkeypatch):
+    users = tmp_path / "users.jsonl"
+    users.write_text('{"username": "ann"}\n', encoding="utf-8")
+    with pytest.raises(SystemExit):
+        run_cli(monkeypatch, str(users), "--output", str(tmp_path / "out"))
+
+
+def test_rows_without_a_model_skip_the_resume(tmp_path, users_csv, monkeypatch):
+    monkeypatch.setattr(model, "model", None)
+    row = batch_generate.read_rows(users_csv)[0]
+    result = batch_generate.process_row(row, str(tmp_path), flowcharts=False)
+    assert "resume.md" not in result['files']
+    assert result['usage']['resume'] is None
@@ -0,0 +1,61 @@
+import pandas as pd
+
+import model
+
+
+def signup(store, tracker, user_id, created_at, skills=()):
+    store.users_db[user_id] = {'created_at': created_at, 'profile': {'skills': list(skills)}}
+    tracker.record_signup(user_id, created_at)
+    tracker.set_profile_skills(user_id, skills)
+
+
+def test_week_start_of_returns_monday():
+    assert model.week_start_of("2026-10-18") == "2026-10-12"
+    assert model.week_start_of("2026-10-12") == "2026-10-12"
+
+
+def test_retention_counts_each_user_once_per_week(store, tracker):
+    signup(store, tracker, "ann", "2026-09-01T10:00:00")
+    signup(store, tracker, "bob", "2026-09-02T10:00:00")
+    for user_id, day in [("ann", "2026-09-01"), ("ann", "2026-09-03"), ("bob", "2026-09-02"), ("ann", "2026-09-09")]:
+        tracker._record_active_user({'user_id': user_id, 'date': day})
+
+    analytics = model.compute_cohort_analytics(store.learning_progress_data, store.users_db)
+    cohort = pd.Timestamp("2026-08-31")
+    assert analytics['cohort_sizes'][cohort] == 2
+    assert analytics['retention'].loc[cohort, 0] == 1.0
+    assert analytics['retention'].loc[cohort, 1] == 0.5
+
+
+def test_profile_skill_counts_follow_profile_changes(store, tracker):
+    signup(store, tracker, "ann", "2026-09-01T10:00:00", ["Python", "SQL"])
+    signup(store, tracker, "bob", "2026-09-01T10:00:00", ["Python"])
+    tracker.set_profile_skills("ann", ["Python", "React"])
+
+    popularity = model.compute_cohort_analytics(store.learning_progress_data, store.users_db)['skill_popularity']
+    assert popularity.loc["Python", 'profile_users'] == 2
+    assert popularity.loc["React", 'profile_users'] == 1
+    assert "SQL" not in popularity.index
+
+
+def test_milestone_medians_measure_days_since_signup(store, tracker):
+    signup(store, tracker, "ann", "2026-09-01T00:00:00")
+    signup(store, tracker, "bob", "2026-09-01T00:00:00")
+    tracker._record_milestone("ann", "Python", {'percentage': 25, 'date': "2026-09-03T00:00:00"})
+    tracker._record_milestone("bob", "Python", {'percentage': 25, 'date': "2026-09-05T00:00:00"})
+
+    medians = model.compute_cohort_analytics(store.learning_progress_data, store.users_db)['milestone_medians']
+    assert medians[25] == 3.0
+
+
+def test_counters_are_rebuilt_for_stores_saved_before_them(store):
+    store.users_db["ann"] = {'created_at': "2026-09-01T10:00:00", 'profile': {'skills': ["Python"]}}
+    data = store.learning_progress_data
+    data['daily_activity'].append({'user_id': "ann", 'date': "2026-09-08", 'activity_type': "Study",
+                                   'duration_minutes': 30, 'details': "", 'timestamp': "2026-09-08T09:00:00"})
+    data['analytics'] = {'daily_active_users': {}, 'weekly_active_users': {}, 'skill_learners': {}, 'milestone_log': []}
+
+    model.LearningProgressTracker(store)
+    analytics = model.compute_cohort_analytics(data, store.users_db)
+    assert analytics['retention'].loc[pd.Timestamp("2026-08-31"), 1] == 1.0
+    assert analytics['skill_popularity'].loc["Python", 'profile_users'] == 1
@@ -0,0 +1,59 @@
+import streamlit as st
+
+import model
+
+
+def build_index(*bodies):
+    index = model.DocumentIndex()
+    for position, body in enumerate(bodies):
+        index.add(('path', position), str(position), 'path', {'goal': str(position)}, body)
+    return index
+
+
+def test_every_word_must_match():
+    index = build_index("Learn Python and SQL", "Learn Python", "Learn Rust")
+    assert [doc_id for doc_id, _, _ in index.search("python sql")] == [0]
+    assert index.search("python go") == []
+
+
+def test_quoted_phrases_match_consecutive_tokens_only():
+    index = build_index("machine learning basics", "learning about machine parts")
+    results = index.search('"machine learning"')
+    assert [doc_id for doc_id, _, _ in results] == [0]
+    assert results[0][2] == [(0, 2)]
+
+
+def test_queries_split_on_the_same_separators_as_documents():
+    index = build_index("Build APIs with Python/Django and node.js")
+    assert [doc_id for doc_id, _, _ in index.search('django "node.js"')] == [0]
+
+
+def test_snippet_bolds_hits_and_keeps_separators():
+    text = "Build APIs with Python/Django and Node.js services"
+    index = build_index(text)
+    (doc_id, _, hits), = index.search("django")
+    assert index.snippet(doc_id, text, hits) == "Build APIs with Python/**Django** and Node.js services"
+
+
+def test_re_adding_a_key_replaces_its_postings():
+    index = build_index("Learn Python")
+    index.add(('path', 0), "v2", 'path', {'goal': "0"}, "Learn Go")
+    assert index.search("python") == []
+    assert [index.docs[doc_id]['meta'] for doc_id, _, _ in index.search("go")] == [{'goal': "0"}]
+    index.remove(('path', 0))
+    assert index.search("learn") == [] and index.versions == {}
+
+
+def test_search_index_follows_revised_and_new_entries():
+    path_store = model.get_path_store()
+    path = {'goal': "Data", 'body_hash': path_store.put("Learn Python and statistics")}
+    st.session_state.users_db = {'index_user': {'learning_paths': [path], 'resumes': [{'path': "Rust resume"}]}}
+
+    index = model.get_search_index('index_user')
+    assert len(index.search("python")) == 1 and len(index.search("rust")) == 1
+
+    path['body_hash'] = path_store.put("Learn Go and statistics")
+    st.session_state.users_db['index_user']['learning_paths'].append({'goal': "Web", 'path': "Learn React"})
+    assert model.get_search_index('index_user') is index
+    assert index.search("python") == []
+    assert len(index.search("go")) == 1 and len(index.search("react")) == 1
@@ -0,0 +1,38 @@
+import model
+
+FIELDS = [
+    {'name': "Web", 'keywords': {'web': 2, 'front-end': 3, 'front end': 2, 'react': 2}},
+    {'name': "Data", 'keywords': {'data': 1.5, 'data science': 4, 'machine learning': 3}},
+]
+DEFAULT = {'name': "General", 'keywords': {}}
+
+
+def test_highest_scoring_field_wins():
+    classifier = model.GoalClassifier(FIELDS, DEFAULT)
+    assert classifier.classify("Become a data science lead")['name'] == "Data"
+    assert classifier.classify("React web apps")['name'] == "Web"
+
+
+def test_spellings_that_tokenize_alike_count_once_at_the_highest_weight():
+    classifier = model.GoalClassifier(FIELDS, DEFAULT)
+    assert classifier._index[("front", "end")] == [(0, 3)]
+
+
+def test_unknown_goals_fall_back_to_the_default_field():
+    classifier = model.GoalClassifier(FIELDS, DEFAULT)
+    assert classifier.classify("Learn to bake bread") is DEFAULT
+    assert classifier.classify("") is DEFAULT
+
+
+def test_results_are_memoized_per_normalized_goal_and_bounded():
+    classifier = model.GoalClassifier(FIELDS, DEFAULT, cache_size=2)
+    classifier.classify("  Data   Science ")
+    assert list(classifier._cache) == ["data science"]
+    for goal in ("web", "react", "machine learning"):
+        classifier.classify(goal)
+    assert list(classifier._cache) == ["react", "machine learning"]
+
+
+def test_app_classifier_maps_common_goals():
+    assert model.classify_goal("Become a Data Scientist")['name'] == "Data Science & Analytics"
+    assert model.classify_goal("Learn to bake bread") is model.DEFAULT_GOAL_FIELD
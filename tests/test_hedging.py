@@ -0,0 +1,66 @@
+import itertools
+import time
+
+import model
+
+
+def timed_calls(*delays):
+    """fn whose n-th call sleeps delays[n] (the last delay repeats) and returns n"""
+    counter = itertools.count()
+
+    def fn():
+        call = next(counter)
+        time.sleep(delays[min(call, len(delays) - 1)])
+        return call
+    return fn
+
+
+def warm(policy, kind, samples, delay=0.01):
+    for _ in range(samples):
+        policy.call(timed_calls(delay), kind=kind)
+    # Latencies are recorded by a done-callback that may run just after the result is returned
+    deadline = time.monotonic() + 1
+    while len(policy._latencies.get(kind, ())) < samples and time.monotonic() < deadline:
+        time.sleep(0.001)
+
+
+def test_no_hedging_until_a_kind_has_enough_samples():
+    policy = model.HedgingPolicy(min_samples=3)
+    warm(policy, "chat", 2)
+    assert policy.threshold("chat") is None
+    assert policy.call(timed_calls(0.05, 0.0), kind="chat") == 0
+    assert policy.metrics()['hedged'] == 0
+
+
+def test_latency_windows_are_kept_per_request_kind():
+    policy = model.HedgingPolicy(min_samples=3)
+    warm(policy, "chat", 3, delay=0.01)
+    warm(policy, "resume", 3, delay=0.1)
+    assert policy.threshold("chat") < 0.05 < policy.threshold("resume")
+    assert policy.threshold("learning_path") is None
+    assert set(policy.metrics()['p95_seconds']) == {"chat", "resume"}
+
+
+def test_slow_call_is_hedged_and_the_backup_can_win():
+    policy = model.HedgingPolicy(min_samples=3)
+    warm(policy, "chat", 3)
+    assert policy.call(timed_calls(0.5, 0.0), kind="chat") == 1
+    metrics = policy.metrics()
+    assert (metrics['hedged'], metrics['hedge_wins']) == (1, 1)
+
+
+def test_hedges_stop_when_the_budget_is_spent():
+    policy = model.HedgingPolicy(budget_per_minute=0, min_samples=3)
+    warm(policy, "chat", 3)
+    assert policy.call(timed_calls(0.1, 0.0), kind="chat") == 0
+    assert policy.metrics()['hedged'] == 0
+
+
+def test_hedged_model_hedges_against_its_request_type():
+    policy = model.HedgingPolicy(min_samples=1)
+    hedged = model.HedgedModel(model.FakeGenerativeModel(0.001, slow_rate=0.0, seed=1), policy)
+    response = hedged.generate_content("Hello", request_type="chat")
+    assert "Hello" in response.text
+    warm(policy, "chat", 1)
+    assert policy.threshold("chat") is not None
+    assert policy.threshold() is None
@@ -0,0 +1,69 @@
+from types import SimpleNamespace
+
+import model
+
+ROUTES = {
+    'chat': [
+        {'max_prompt_chars': 100, 'tiers': ['fast', 'standard'], 'latency_budget': 1.0},
+        {'max_prompt_chars': None, 'tiers': ['standard', 'fast'], 'latency_budget': None}
+    ],
+    'default': [{'max_prompt_chars': None, 'tiers': ['standard'], 'latency_budget': None}]
+}
+
+
+class StubTier:
+    def __init__(self, name, fail=False):
+        self.name = name
+        self.fail = fail
+        self.calls = []
+
+    def generate_content(self, contents, **kwargs):
+        self.calls.append(kwargs)
+        if self.fail:
+            raise RuntimeError(f"{self.name} unavailable")
+        usage = SimpleNamespace(prompt_token_count=10, cached_content_token_count=4)
+        return SimpleNamespace(text=self.name, usage_metadata=usage)
+
+
+def make_router(**tiers):
+    return model.ModelRouter(tiers, ROUTES, min_samples=2)
+
+
+def test_routes_pick_tiers_by_request_type_and_prompt_size():
+    router = make_router(fast=StubTier("fast"), standard=StubTier("standard"))
+    assert router.candidates("chat", 50) == ["fast", "standard"]
+    assert router.candidates("chat", 500) == ["standard", "fast"]
+    assert router.candidates("resume", 50) == ["standard"]
+
+
+def test_tiers_over_the_latency_budget_are_tried_last():
+    router = make_router(fast=StubTier("fast"), standard=StubTier("standard"))
+    router._latencies['fast'].extend([2.0, 3.0])
+    assert router.candidates("chat", 50) == ["standard", "fast"]
+
+
+def test_failing_tier_fails_over_and_cools_down():
+    fast, standard = StubTier("fast", fail=True), StubTier("standard")
+    router = make_router(fast=fast, standard=standard)
+    assert router.generate_content("hi", request_type="chat").text == "standard"
+    assert router.candidates("chat", 50) == ["standard", "fast"]
+    stats = {row['tier']: row for row in router.metrics()}
+    assert stats['fast']['failures'] == 1 and stats['standard']['failovers'] == 1
+
+
+def test_token_usage_is_totalled_per_request_type():
+    router = make_router(fast=StubTier("fast"), standard=StubTier("standard"))
+    router.generate_content("hi", request_type="chat")
+    router.generate_content("hi", request_type="chat")
+    assert router.token_usage() == [{'request_type': "chat", 'calls': 2, 'prompt_tokens': 20,
+                                     'cached_tokens': 8, 'fresh_tokens': 12}]
+
+
+def test_only_hedged_tiers_receive_the_request_type():
+    fast, standard = StubTier("fast"), StubTier("standard")
+    router = model.ModelRouter({'fast': fast, 'standard': standard}, ROUTES,
+                               hedging_policies={'standard': model.HedgingPolicy()})
+    router.generate_content("x" * 500, request_type="chat")
+    router.generate_content("hi", request_type="chat")
+    assert standard.calls == [{'request_type': "chat"}]
+    assert fast.calls == [{}]
@@ -0,0 +1,56 @@
+import threading
+
+import model
+
+
+def blocking_job(release):
+    def job(value):
+        release.wait(5)
+        return value
+    return job
+
+
+def test_claim_with_matching_inputs_reuses_the_speculative_run():
+    prefetcher = model.PathPrefetcher()
+    key = prefetcher.make_key("ann", "Data Scientist")
+    prefetcher.speculate("ann", key, lambda goal: f"path for {goal}", "Data Scientist")
+    future = prefetcher.claim("ann", key)
+    assert future.result(5) == "path for Data Scientist"
+    assert prefetcher.wasted_today("ann") == 0
+
+
+def test_replaced_runs_stay_charged_and_claimed_inputs_are_not_speculated_again():
+    release = threading.Event()
+    prefetcher = model.PathPrefetcher()
+    calls = []
+    job = blocking_job(release)
+
+    prefetcher.speculate("ann", "k1", lambda: calls.append("k1") or job("k1"))
+    prefetcher.speculate("ann", "k2", lambda: calls.append("k2") or job("k2"))
+    release.set()
+    assert prefetcher.claim("ann", "k2").result(5) == "k2"
+    assert prefetcher.wasted_today("ann") == 1
+
+    prefetcher.speculate("ann", "k2", lambda: calls.append("again"))
+    assert prefetcher.claim("ann", "k3") is None
+    assert "again" not in calls
+
+
+def test_queued_runs_are_refunded_when_cancelled():
+    release = threading.Event()
+    prefetcher = model.PathPrefetcher(max_workers=1)
+    prefetcher.speculate("ann", "busy", blocking_job(release), "busy")
+    prefetcher.speculate("bob", "queued", blocking_job(release), "queued")
+    assert prefetcher.claim("bob", "other") is None
+    assert prefetcher.wasted_today("bob") == 0
+    release.set()
+
+
+def test_speculation_stops_at_the_daily_waste_limit():
+    release = threading.Event()
+    prefetcher = model.PathPrefetcher(waste_limit=2)
+    for key in ("k1", "k2", "k3", "k4"):
+        prefetcher.speculate("ann", key, blocking_job(release), key)
+    release.set()
+    assert prefetcher.wasted_today("ann") == 2
+    assert prefetcher.claim("ann", "k4") is None
@@ -0,0 +1,34 @@
+import model
+
+ZDICT = (model.BASIC_LEARNING_PATH_TEMPLATE + model.CAREER_PATH_TEMPLATE).encode("utf-8")
+
+
+def test_bodies_round_trip():
+    path_store = model.PathStore(ZDICT)
+    body = "# 🚀 Learning Path: Rust\n\n- Ownership & borrowing\n- Async with tokio — ünïcödé"
+    digest = path_store.put(body)
+    assert digest in path_store
+    assert path_store.get(digest) == body
+
+
+def test_identical_bodies_are_stored_once():
+    path_store = model.PathStore(ZDICT)
+    first = path_store.put("same body")
+    stored = path_store.stored_bytes()
+    assert path_store.put("same body") == first
+    assert path_store.stored_bytes() == stored
+    assert path_store.put("other body") != first
+
+
+def test_template_shaped_bodies_compress_against_the_dictionary():
+    body = model.render_basic_learning_path("Become a Data Scientist", "Beginner", "5-10 hours", ("Python",))
+    with_dictionary, without = model.PathStore(ZDICT), model.PathStore(b"")
+    with_dictionary.put(body)
+    without.put(body)
+    assert with_dictionary.stored_bytes() < without.stored_bytes() < len(body.encode("utf-8"))
+
+
+def test_saved_paths_load_from_the_store_or_inline():
+    digest = model.get_path_store().put("stored body")
+    assert model.load_path_body({'body_hash': digest, 'path': "stale"}) == "stored body"
+    assert model.load_path_body({'path': "legacy inline body"}) == "legacy inline body"
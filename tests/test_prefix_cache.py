@@ -0,0 +1,61 @@
+from datetime import timedelta
+from types import SimpleNamespace
+
+import model
+
+
+class StubModel:
+    def __init__(self, refuse=False):
+        self.refuse = refuse
+        self.bound_prefixes = []
+        self.sent = []
+
+    def with_cached_prefix(self, prefix):
+        if self.refuse:
+            raise ValueError("prefix below the minimum cache size")
+        self.bound_prefixes.append(prefix)
+        return SimpleNamespace(generate_content=lambda contents, **kwargs: self.sent.append(("cached", prefix, contents)))
+
+    def generate_content(self, contents, **kwargs):
+        self.sent.append(("inline", None, contents))
+
+
+def test_each_prefix_is_bound_once_and_reused():
+    stub = StubModel()
+    cached = model.PrefixCachedModel(stub, "test-model")
+    for question in ("q1", "q2"):
+        cached.generate_content(question, prefix="SYSTEM A")
+    cached.generate_content("q3", prefix="SYSTEM B")
+    assert stub.bound_prefixes == ["SYSTEM A", "SYSTEM B"]
+    assert stub.sent == [("cached", "SYSTEM A", "q1"), ("cached", "SYSTEM A", "q2"), ("cached", "SYSTEM B", "q3")]
+
+
+def test_requests_without_a_prefix_go_straight_to_the_model():
+    stub = StubModel()
+    model.PrefixCachedModel(stub, "test-model").generate_content("hello")
+    assert stub.sent == [("inline", None, "hello")] and stub.bound_prefixes == []
+
+
+def test_refused_prefixes_are_sent_inline_and_not_retried_immediately():
+    stub = StubModel(refuse=True)
+    cached = model.PrefixCachedModel(stub, "test-model")
+    cached.generate_content("q1", prefix="SHORT")
+    stub.refuse = False
+    cached.generate_content("q2", prefix="SHORT")
+    assert stub.sent == [("inline", None, "SHORT\nq1"), ("inline", None, "SHORT\nq2")]
+    assert stub.bound_prefixes == []
+
+
+def test_expired_bindings_are_renewed():
+    stub = StubModel()
+    # Bindings are renewed a minute before the TTL, so a 30 second TTL is due again at once
+    cached = model.PrefixCachedModel(stub, "test-model", ttl=timedelta(seconds=30))
+    cached.generate_content("q1", prefix="SYSTEM")
+    cached.generate_content("q2", prefix="SYSTEM")
+    assert stub.bound_prefixes == ["SYSTEM", "SYSTEM"]
+
+
+def test_fake_model_reports_the_prefix_as_cached_tokens():
+    cached = model.PrefixCachedModel(model.FakeGenerativeModel(0.001, slow_rate=0.0, seed=1), "test-model")
+    usage = model.prompt_usage(cached.generate_content("fresh part", prefix="P" * 400))
+    assert usage['cached_tokens'] == 100 and usage['fresh_tokens'] == len("fresh part") // 4
@@ -0,0 +1,36 @@
+import model
+
+
+def make_extractor():
+    return model.SkillExtractor(["Python", "Node.js", "SQL", "Machine Learning"],
+                                {'django': "Python", 'pl/sql': "SQL", 'deep learning': "Machine Learning"},
+                                ["web developer", "management"])
+
+
+def test_aliases_map_to_canonical_skills_in_order_of_appearance():
+    skills, keywords = make_extractor().extract("Built ML services with Django, PL/SQL and deep learning")
+    assert skills == ["Python", "SQL", "Machine Learning"]
+    assert keywords == []
+
+
+def test_separators_split_tokens():
+    skills, _ = make_extractor().extract("Python/Django, Node.js-based APIs, SQL.")
+    assert skills == ["Python", "Node.js", "SQL"]
+
+
+def test_field_keywords_are_returned_apart_from_skills():
+    skills, keywords = make_extractor().extract("Senior web developer moving into management; Python daily")
+    assert skills == ["Python"]
+    assert keywords == ["web developer", "management"]
+
+
+def test_longest_phrase_wins():
+    extractor = model.SkillExtractor(["C", "C++"], {'c plus plus': "C++"})
+    skills, _ = extractor.extract("Wrote drivers in C plus plus")
+    assert skills == ["C++"]
+
+
+def test_app_extractor_never_reports_field_keywords_as_skills():
+    skills, keywords = model.get_skill_extractor().extract("Web developer with management and design experience")
+    assert set(skills) <= set(model.AVAILABLE_SKILLS)
+    assert keywords
@@ -0,0 +1,56 @@
+import pytest
+
+import model
+
+
+@pytest.fixture(scope="module")
+def planner():
+    return model.SkillGraphPlanner(model.SKILL_GRAPH, model.FIELD_TARGET_SKILLS)
+
+
+def test_graph_errors_are_reported():
+    missing = {**model.SKILL_GRAPH, 'React': {'requires': ('Redux',), 'hours': 1, 'description': ""}}
+    with pytest.raises(ValueError, match="missing nodes: Redux"):
+        model.SkillGraphPlanner(missing, {})
+    cyclic = {**model.SKILL_GRAPH, 'Computer Basics': {'requires': ('SQL',), 'hours': 1, 'description': ""}}
+    with pytest.raises(ValueError, match="cycle"):
+        model.SkillGraphPlanner(cyclic, {})
+
+
+def test_sequence_puts_every_prerequisite_first(planner):
+    sequence, skipped = planner.module_sequence(("Machine Learning",), known=())
+    assert skipped == []
+    assert sequence[-1] == "Machine Learning"
+    for position, skill in enumerate(sequence):
+        assert set(model.SKILL_GRAPH[skill]['requires']) <= set(sequence[:position])
+
+
+def test_known_skills_drop_their_prerequisites(planner):
+    sequence, skipped = planner.module_sequence(("Data Science",), known=("Python",))
+    assert "Python" not in sequence and "Programming Fundamentals" not in sequence
+    assert skipped == ["Programming Fundamentals", "Python"]
+
+
+def test_goal_targets_combine_named_skills_and_field_targets(planner):
+    assert planner.target_skills("Become a Data Scientist") == model.FIELD_TARGET_SKILLS['Data Science & Analytics']
+    assert planner.target_skills("Learn pottery") == ()
+    assert "SQL" in planner.target_skills("Learn SQL")
+
+
+def test_plan_phases_are_contiguous_and_end_with_a_capstone(planner):
+    plan = planner.plan("Become a Data Scientist", "Beginner", "6-10 hours", ("Python",))
+    assert [phase.title for phase in plan.phases] == list(model.PLAN_PHASE_NAMES[:len(plan.phases)])
+    assert plan.phases[-1].modules[-1].title == "Capstone: Become a Data Scientist"
+    assert "Python" not in [module.title for phase in plan.phases for module in phase.modules]
+    assert all(module.duration_weeks >= 1 for phase in plan.phases for module in phase.modules)
+
+
+def test_more_weekly_hours_shorten_the_plan(planner):
+    def total_weeks(time_commitment):
+        plan = planner.plan("Learn Web Development", "Beginner", time_commitment, ())
+        return sum(phase.duration_weeks for phase in plan.phases)
+    assert total_weeks("20+ hours") < total_weeks("1-5 hours")
+
+
+def test_unknown_goals_get_no_plan(planner):
+    assert planner.plan("Learn to bake bread", "Beginner", "1-5 hours", ()) is None
@@ -0,0 +1,71 @@
+import itertools
+
+import numpy as np
+
+import model
+
+
+def pair_counts(recommender):
+    """Folded co-occurrence counts as {(skill, skill): users}"""
+    recommender._fold()
+    counts = recommender._counts.toarray()
+    names = recommender.skill_names
+    return {(names[i], names[j]): int(counts[i, j]) for i, j in zip(*np.nonzero(counts))}
+
+
+def test_each_user_counts_once_per_skill_pair():
+    recommender = model.SkillCooccurrenceRecommender(refresh_seconds=0)
+    recommender.update_user("ann", profile_skills=["Python", "SQL"], progress_skills=["Python"])
+    recommender.update_user("bob", profile_skills=["Python", "SQL", "Statistics"])
+    counts = pair_counts(recommender)
+    assert counts[("Python", "SQL")] == counts[("SQL", "Python")] == 2
+    assert counts[("Python", "Python")] == 2
+    assert counts[("SQL", "Statistics")] == 1
+
+
+def test_replacing_a_users_skills_removes_their_old_pairs():
+    recommender = model.SkillCooccurrenceRecommender(refresh_seconds=0)
+    recommender.update_user("ann", profile_skills=["Python", "SQL"])
+    recommender.update_user("ann", profile_skills=["Python", "React"])
+    counts = pair_counts(recommender)
+    assert ("Python", "SQL") not in counts and ("SQL", "SQL") not in counts
+    assert counts[("Python", "React")] == 1
+
+
+def test_counts_match_a_full_rebuild_after_many_updates():
+    rng = np.random.default_rng(3)
+    skills = [f"skill{i}" for i in range(8)]
+    incremental = model.SkillCooccurrenceRecommender(refresh_seconds=0)
+    final = {}
+    for step in range(200):
+        user = f"user{rng.integers(20)}"
+        final[user] = list(rng.choice(skills, size=rng.integers(0, 5), replace=False))
+        incremental.update_user(user, profile_skills=final[user])
+        if step % 37 == 0:
+            incremental._fold()
+
+    expected = {}
+    for user_skills in final.values():
+        for first, second in itertools.product(user_skills, repeat=2):
+            expected[(first, second)] = expected.get((first, second), 0) + 1
+    assert pair_counts(incremental) == expected
+
+
+def test_recommends_frequent_co_skills_the_user_lacks():
+    recommender = model.SkillCooccurrenceRecommender(min_cooccurrence=2, refresh_seconds=0)
+    for user in ("a", "b", "c"):
+        recommender.update_user(user, profile_skills=["Python", "SQL", "Data Science"])
+    recommender.update_user("d", profile_skills=["Python", "Rust"])
+    recommender.update_user("new", profile_skills=["Python"])
+    assert sorted(recommender.recommend("new", k=2)) == ["Data Science", "SQL"]
+    assert "Rust" not in recommender.recommend("new", k=5)
+    assert recommender.recommend("nobody") == []
+
+
+def test_tracker_feeds_profile_and_progress_skills_to_the_recommender(store, tracker):
+    store.users_db["ann"] = {'profile': {'skills': []}}
+    tracker.set_profile_skills("ann", ["Python"])
+    tracker.update_skill_progress("ann", "SQL", 10)
+    assert store.users_db["ann"]['profile']['skills'] == ["Python"]
+    assert tracker.recommender._user_skills["ann"] == {tracker.recommender.skill_ids["Python"],
+                                                       tracker.recommender.skill_ids["SQL"]}
@@ -0,0 +1,45 @@
+from concurrent.futures import Future
+
+import model
+
+LONG_PATH = "\n".join(
+    [f"## Phase {phase}\n" + "\n".join(f"- Study topic {phase}.{item} with a short hands-on exercise." for item in range(8))
+     for phase in range(1, 6)]
+)
+
+
+def test_markdown_is_stripped_before_speaking():
+    text = model.strip_markdown_for_speech("## 🚀 Start\n- [ ] Read [the docs](https://example.com) **today**")
+    assert "#" not in text and "**" not in text and "https" not in text
+    assert "the docs" in text and "today" in text
+
+
+def test_first_chunk_is_short_and_later_chunks_are_packed():
+    chunks = model.split_speech_chunks(LONG_PATH, first_chunk_chars=200, max_chunk_chars=800)
+    assert len(chunks) > 2
+    assert len(chunks[0]) <= 200
+    assert all(len(chunk) <= 800 for chunk in chunks[1:])
+    assert max(len(chunk) for chunk in chunks[1:]) > 200
+
+
+def test_chunks_keep_every_sentence_in_order():
+    chunks = model.split_speech_chunks(LONG_PATH)
+    spoken = " ".join(chunks)
+    positions = [spoken.index(f"topic {phase}.{item} ") for phase in range(1, 6) for item in range(8)]
+    assert positions == sorted(positions)
+
+
+def test_lines_without_punctuation_end_as_sentences():
+    assert model.split_speech_chunks("# Intro\nLearn Python") == ["Intro. Learn Python."]
+
+
+def test_empty_text_has_no_chunks():
+    assert model.split_speech_chunks("") == []
+
+
+def test_finished_chunks_count_only_the_leading_run():
+    done, failed, pending = Future(), Future(), Future()
+    done.set_result(b"wav")
+    failed.set_exception(RuntimeError("engine crashed"))
+    assert model.count_finished_chunks([done, failed, pending, done]) == 2
+    assert model.count_finished_chunks([pending, done]) == 0